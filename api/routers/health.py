@@ -4,11 +4,13 @@ Health Check API Router
 Provides system health and monitoring endpoints.
 """
 import os
-from fastapi import APIRouter, Depends
+from datetime import datetime, timedelta, timezone
+from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from core.config import settings
+from core.models import WorkerHeartbeat
 from infra.db import get_db
 
 router = APIRouter()
@@ -39,3 +41,58 @@ async def health_check(db: AsyncSession = Depends(get_db)):
         health_status["database"] = f"error: {str(e)}"
         
     return health_status
+
+
+@router.get("/ready")
+async def readiness_check(response: Response, db: AsyncSession = Depends(get_db)):
+    """
+    Readiness check endpoint.
+    
+    Unlike the liveness check above, this reports whether the system can
+    actually process notes:
+    - Database connectivity (the API is not ready without it; returns 503)
+    - Per-worker heartbeats, including whether models are loaded and warm
+    
+    `workers_ready` is true when every pipeline stage (PIPELINE_WORKERS) has
+    at least one live, ready instance; stages without one are listed in
+    `missing_workers`. A worker whose model failed to load reports
+    `degraded` and does not count as ready.
+    """
+    readiness = {
+        "ready": False,
+        "database": "unknown",
+        "workers_ready": False,
+        "missing_workers": list(settings.PIPELINE_WORKERS),
+        "workers": [],
+    }
+
+    try:
+        result = await db.execute(select(WorkerHeartbeat).order_by(WorkerHeartbeat.name, WorkerHeartbeat.worker_id))
+        heartbeats = result.scalars().all()
+        readiness["database"] = "ok"
+    except Exception as e:
+        readiness["database"] = f"error: {str(e)}"
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return readiness
+
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.WORKER_HEARTBEAT_TIMEOUT)
+    ready_names = set()
+    for heartbeat in heartbeats:
+        alive = heartbeat.last_heartbeat >= cutoff
+        ready = alive and heartbeat.state == "ready"
+        if ready:
+            ready_names.add(heartbeat.name)
+        readiness["workers"].append({
+            "worker_id": heartbeat.worker_id,
+            "name": heartbeat.name,
+            "state": heartbeat.state if alive else "dead",
+            "model_loaded": heartbeat.model_loaded,
+            "warm": heartbeat.warm,
+            "started_at": heartbeat.started_at,
+            "last_heartbeat": heartbeat.last_heartbeat,
+        })
+
+    readiness["ready"] = True
+    readiness["missing_workers"] = [name for name in settings.PIPELINE_WORKERS if name not in ready_names]
+    readiness["workers_ready"] = not readiness["missing_workers"]
+    return readiness
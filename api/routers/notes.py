@@ -1,23 +1,41 @@
 """
 Notes API Router
 
-Handles all note-related endpoints including audio upload, listing, and retrieval.
+Handles all note-related endpoints including audio upload, bulk ingest,
+export, listing, tag statistics, and retrieval.
 """
+import asyncio
 import shutil
 import os
+import tempfile
 import uuid
-from typing import List, Optional
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, status
+import zipfile
+import zlib
+from datetime import datetime
+from typing import IO, Any, AsyncIterator, Dict, List, Optional
+from fastapi import APIRouter, Depends, Query, Request, UploadFile, File, Form, HTTPException, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, insert
+from sqlalchemy.orm import selectinload
 
 from core.config import settings
-from core.models import Note, NoteStatus
-from api.schemas import NoteRead, NoteList, NoteCreate, NoteTextCreate
-from infra.db import get_db
+from core.models import Note, NoteStatus, NoteTranscript, TagCount
+from api.schemas import NoteRead, NoteList, NoteCreate, NoteTextCreate, BulkItemResult, TagCountRead
+from infra.db import get_db, AsyncSessionLocal
+from infra.tags import increment_tag_counts
 
 router = APIRouter()
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+GZIP_MEDIA_TYPE = "application/gzip"
+
+# Target size of each chunk written to the response while exporting
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+AUDIO_EXTENSIONS = {"wav", "mp3", "m4a", "mp4", "ogg", "oga", "opus", "flac", "webm", "aac", "wma", "amr"}
+
 
 @router.post("/text", response_model=NoteRead, status_code=status.HTTP_201_CREATED)
 async def create_text_note(
@@ -44,14 +62,16 @@ async def create_text_note(
         title=note_data.title,
         source_filename="text_input",
         audio_path="",  # No audio file for text notes
-        transcript=note_data.content,
         status=NoteStatus.TRANSCRIBED,
-        tags=note_data.tags
+        tags=note_data.tags,
+        transcript_record=NoteTranscript(content=note_data.content)
     )
     
     db.add(new_note)
+    await increment_tag_counts(db, [note_data.tags])
     await db.commit()
-    await db.refresh(new_note)
+    # Only reload server-generated columns; a full refresh would unload the transcript
+    await db.refresh(new_note, ["created_at", "updated_at"])
     
     return new_note
 
@@ -96,24 +116,359 @@ async def upload_audio_note(
     )
     
     db.add(new_note)
+    await increment_tag_counts(db, [tags])
     await db.commit()
     await db.refresh(new_note)
     
     return new_note
 
 
+async def _spool_request_body(request: Request) -> IO[bytes]:
+    """
+    Copy the raw request body to an anonymous temporary file.
+
+    A StreamingResponse listens for client disconnects on the same receive
+    channel as the request body, so the body must be consumed before the
+    response starts streaming.
+    """
+    spool = tempfile.TemporaryFile()
+    try:
+        async for chunk in request.stream():
+            spool.write(chunk)
+    except Exception:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
+def _ndjson(result: BulkItemResult) -> str:
+    return result.model_dump_json(exclude_none=True) + "\n"
+
+
+def _remove_file(path: str) -> None:
+    if path and os.path.exists(path):
+        os.remove(path)
+
+
+async def _flush_batch(rows: List[Dict[str, Any]], pending: List[BulkItemResult]) -> List[BulkItemResult]:
+    """
+    Insert a batch of note rows with a single multi-row INSERT and commit.
+
+    The streaming endpoints outlive the request-scoped session, so each batch
+    uses its own. On failure every item in the batch is reported as an error
+    and any audio already extracted for it is removed.
+    """
+    # Transcripts go to their side table in the same transaction
+    transcript_rows = [
+        {"note_id": row["id"], "content": row.pop("transcript")}
+        for row in rows if "transcript" in row
+    ]
+
+    async with AsyncSessionLocal() as session:
+        try:
+            await session.execute(insert(Note), rows)
+            if transcript_rows:
+                await session.execute(insert(NoteTranscript), transcript_rows)
+            await increment_tag_counts(session, [row["tags"] for row in rows])
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            for row in rows:
+                _remove_file(row["audio_path"])
+            for result in pending:
+                result.id = None
+                result.error = f"Could not save batch: {str(e)}"
+
+    rows.clear()
+    results = list(pending)
+    pending.clear()
+    return results
+
+
+async def _bulk_text_results(spool: IO[bytes]) -> AsyncIterator[str]:
+    rows: List[Dict[str, Any]] = []
+    pending: List[BulkItemResult] = []
+
+    try:
+        for line_number, line in enumerate(spool, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                note_data = NoteTextCreate.model_validate_json(line)
+            except ValidationError as e:
+                errors = "; ".join(error["msg"] for error in e.errors())
+                yield _ndjson(BulkItemResult(line=line_number, error=errors))
+                continue
+
+            note_id = uuid.uuid4()
+            rows.append({
+                "id": note_id,
+                "title": note_data.title,
+                "source_filename": "text_input",
+                "audio_path": "",
+                "transcript": note_data.content,
+                "status": NoteStatus.TRANSCRIBED,
+                "tags": note_data.tags,
+            })
+            pending.append(BulkItemResult(line=line_number, id=note_id))
+
+            if len(rows) >= settings.BULK_INSERT_BATCH_SIZE:
+                for result in await _flush_batch(rows, pending):
+                    yield _ndjson(result)
+
+        if rows:
+            for result in await _flush_batch(rows, pending):
+                yield _ndjson(result)
+    finally:
+        spool.close()
+
+
+def _check_archive_limits(spool: IO[bytes]) -> Optional[str]:
+    """
+    Return why the archive is too large to ingest, or None.
+
+    Declared sizes can be trusted here: zipfile stops reading an entry at its
+    declared size, so extraction never writes more than this total.
+    """
+    with zipfile.ZipFile(spool) as archive:
+        entries = archive.infolist()
+    if len(entries) > settings.BULK_AUDIO_MAX_ENTRIES:
+        return f"Archive has {len(entries)} entries, the limit is {settings.BULK_AUDIO_MAX_ENTRIES}"
+    total_size = sum(info.file_size for info in entries)
+    if total_size > settings.BULK_AUDIO_MAX_UNCOMPRESSED_BYTES:
+        return (
+            f"Archive expands to {total_size} bytes, "
+            f"the limit is {settings.BULK_AUDIO_MAX_UNCOMPRESSED_BYTES}"
+        )
+    return None
+
+
+def _extract_member(archive: zipfile.ZipFile, info: zipfile.ZipInfo, file_path: str) -> None:
+    with archive.open(info) as source, open(file_path, "wb") as buffer:
+        shutil.copyfileobj(source, buffer)
+
+
+async def _bulk_audio_results(spool: IO[bytes], tags: Optional[List[str]]) -> AsyncIterator[str]:
+    rows: List[Dict[str, Any]] = []
+    pending: List[BulkItemResult] = []
+
+    try:
+        with zipfile.ZipFile(spool) as archive:
+            for info in archive.infolist():
+                filename = os.path.basename(info.filename)
+                # Skip directories and resource-fork/hidden entries (e.g. __MACOSX/._foo.m4a)
+                if info.is_dir() or not filename or filename.startswith("."):
+                    continue
+
+                file_ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+                if file_ext not in AUDIO_EXTENSIONS:
+                    yield _ndjson(BulkItemResult(filename=filename, error="Unsupported file type"))
+                    continue
+
+                # Never use archive paths on disk; files are stored by note ID like single uploads
+                note_id = uuid.uuid4()
+                file_path = os.path.join(settings.INBOX_DIR, f"{note_id}.{file_ext}")
+                try:
+                    await asyncio.to_thread(_extract_member, archive, info, file_path)
+                except Exception as e:
+                    _remove_file(file_path)
+                    yield _ndjson(BulkItemResult(filename=filename, error=f"Could not save file: {str(e)}"))
+                    continue
+
+                rows.append({
+                    "id": note_id,
+                    "title": None,
+                    "source_filename": filename,
+                    "audio_path": file_path,
+                    "status": NoteStatus.UPLOADED,
+                    "tags": tags,
+                })
+                pending.append(BulkItemResult(filename=filename, id=note_id))
+
+                if len(rows) >= settings.BULK_INSERT_BATCH_SIZE:
+                    for result in await _flush_batch(rows, pending):
+                        yield _ndjson(result)
+
+        if rows:
+            for result in await _flush_batch(rows, pending):
+                yield _ndjson(result)
+    finally:
+        # Files extracted for a batch that was never flushed (e.g. the client
+        # disconnected mid-stream) have no note pointing at them
+        for row in rows:
+            _remove_file(row["audio_path"])
+        spool.close()
+
+
+@router.post(
+    "/text/bulk",
+    response_class=StreamingResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {NDJSON_MEDIA_TYPE: {"schema": {"$ref": "#/components/schemas/NoteTextCreate"}}},
+        }
+    },
+)
+async def bulk_create_text_notes(request: Request):
+    """
+    Create many text notes from an NDJSON stream.
+
+    Each line of the request body is a `NoteTextCreate` object. Notes are
+    inserted in batches of `BULK_INSERT_BATCH_SIZE` with one multi-row INSERT
+    and one commit per batch, and a `BulkItemResult` line is streamed back for
+    every input line (with the new note ID or an error).
+    """
+    spool = await _spool_request_body(request)
+    return StreamingResponse(_bulk_text_results(spool), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.post("/audio/bulk", response_class=StreamingResponse)
+async def bulk_upload_audio_notes(
+    file: UploadFile = File(...),
+    tags: Optional[List[str]] = Form(None),
+):
+    """
+    Upload a zip archive of audio files to create one note per file.
+
+    Each audio file is extracted to the inbox and recorded with status
+    UPLOADED, batched like the text bulk endpoint. A `BulkItemResult` line is
+    streamed back per archive entry. Tags, if given, apply to every note.
+    Archives with more than `BULK_AUDIO_MAX_ENTRIES` entries or expanding to
+    more than `BULK_AUDIO_MAX_UNCOMPRESSED_BYTES` are rejected with 413.
+    """
+    # The upload is closed before the response streams, so spool it to our own file first
+    spool = tempfile.TemporaryFile()
+    try:
+        shutil.copyfileobj(file.file, spool)
+    except Exception as e:
+        spool.close()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Could not save file: {str(e)}"
+        )
+
+    if not zipfile.is_zipfile(spool):
+        spool.close()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Uploaded file is not a zip archive"
+        )
+
+    limit_error = _check_archive_limits(spool)
+    if limit_error:
+        spool.close()
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=limit_error
+        )
+
+    return StreamingResponse(_bulk_audio_results(spool, tags), media_type=NDJSON_MEDIA_TYPE)
+
+
+async def _export_chunks(query, compress: bool) -> AsyncIterator[bytes]:
+    """
+    Stream notes as NDJSON straight from a server-side cursor.
+
+    Rows are fetched `EXPORT_BATCH_SIZE` at a time and serialized lines are
+    coalesced into ~64 KiB chunks (gzip-compressed on the fly if requested),
+    so memory use stays constant regardless of how many notes are exported.
+    """
+    compressor = zlib.compressobj(wbits=31) if compress else None  # wbits=31 writes a gzip container
+    buffer: List[bytes] = []
+    buffered = 0
+
+    def drain() -> bytes:
+        nonlocal buffered
+        data = b"".join(buffer)
+        buffer.clear()
+        buffered = 0
+        return compressor.compress(data) if compressor else data
+
+    async with AsyncSessionLocal() as session:
+        result = await session.stream_scalars(
+            query.execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+        )
+        async for note in result:
+            line = NoteRead.model_validate(note).model_dump_json().encode() + b"\n"
+            buffer.append(line)
+            buffered += len(line)
+            if buffered >= EXPORT_CHUNK_SIZE:
+                chunk = drain()
+                if chunk:
+                    yield chunk
+
+    chunk = drain()
+    if compressor:
+        chunk += compressor.flush()
+    if chunk:
+        yield chunk
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_notes(
+    status_filter: Optional[NoteStatus] = Query(None, alias="status"),
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    gzip: bool = False,
+):
+    """
+    Export notes as NDJSON, one `NoteRead` object per line.
+
+    Results are ordered by creation time and streamed from a server-side
+    cursor, so exports of any size run in constant memory. Optionally filter
+    by status and creation time range, and gzip the output for backups.
+    """
+    query = select(Note).options(selectinload(Note.transcript_record)).order_by(Note.created_at)
+    if status_filter is not None:
+        query = query.where(Note.status == status_filter)
+    if created_after is not None:
+        query = query.where(Note.created_at >= created_after)
+    if created_before is not None:
+        query = query.where(Note.created_at < created_before)
+
+    filename = "notes.ndjson.gz" if gzip else "notes.ndjson"
+    return StreamingResponse(
+        _export_chunks(query, compress=gzip),
+        media_type=GZIP_MEDIA_TYPE if gzip else NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/tags", response_model=List[TagCountRead])
+async def list_tags(
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    List all tags with the number of notes carrying each, most used first.
+    
+    Served from an incrementally maintained aggregate rather than a scan of
+    every note.
+    """
+    query = select(TagCount).where(TagCount.count > 0).order_by(desc(TagCount.count), TagCount.tag)
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
 @router.get("/", response_model=List[NoteList])
 async def list_notes(
     skip: int = 0,
     limit: int = 100,
+    tag: Optional[List[str]] = Query(None),
     db: AsyncSession = Depends(get_db)
 ):
     """
     List recent notes with pagination.
     
     Returns a simplified view of notes ordered by creation time (newest first).
+    Pass `tag` (repeatable) to only return notes carrying all given tags.
     """
     query = select(Note).order_by(desc(Note.created_at)).offset(skip).limit(limit)
+    if tag:
+        # JSONB containment, served by the GIN index on notes.tags
+        query = query.where(Note.tags.contains(tag))
     result = await db.execute(query)
     notes = result.scalars().all()
     return notes
@@ -130,7 +485,7 @@ async def get_note(
     Returns complete note information including transcript, summary,
     action items, and metadata if available.
     """
-    query = select(Note).where(Note.id == note_id)
+    query = select(Note).options(selectinload(Note.transcript_record)).where(Note.id == note_id)
     result = await db.execute(query)
     note = result.scalar_one_or_none()
     
@@ -22,6 +22,11 @@ class NoteUpdate(NoteBase):
     action_items: Optional[List[str]] = None
     metadata_: Optional[Dict[str, Any]] = None
 
+class TranscriptSegment(BaseModel):
+    start: float
+    end: float
+    text: str
+
 class NoteRead(NoteBase):
     id: UUID
     status: NoteStatus
@@ -29,7 +34,9 @@ class NoteRead(NoteBase):
     updated_at: datetime
     source_filename: str
     audio_path: str
+    duration_seconds: Optional[float] = None
     transcript: Optional[str] = None
+    segments: Optional[List[TranscriptSegment]] = None
     summary: Optional[str] = None
     action_items: Optional[List[str]] = None
     metadata_: Optional[Dict[str, Any]] = None
@@ -44,3 +51,16 @@ class NoteList(BaseModel):
     tags: Optional[List[str]] = None
 
     model_config = ConfigDict(from_attributes=True)
+
+class BulkItemResult(BaseModel):
+    """Per-item outcome streamed back (as NDJSON) by the bulk ingest endpoints."""
+    line: Optional[int] = None
+    filename: Optional[str] = None
+    id: Optional[UUID] = None
+    error: Optional[str] = None
+
+class TagCountRead(BaseModel):
+    tag: str
+    count: int
+
+    model_config = ConfigDict(from_attributes=True)
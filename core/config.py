@@ -22,6 +22,33 @@ class Settings(BaseSettings):
     WHISPER_MODEL_SIZE: str = "base"
     LLM_MODEL_PATH: str = "/models/llama-2-7b-chat.Q4_K_M.gguf" # Example default
 
+    # Workers
+    WORKER_HEARTBEAT_INTERVAL: int = 10 # seconds
+    WORKER_HEARTBEAT_TIMEOUT: int = 60 # seconds without a heartbeat before a worker counts as dead
+    WORKER_HEARTBEAT_RETENTION: int = 3600 # seconds a dead worker's heartbeat row is kept (listed as "dead")
+    PIPELINE_WORKERS: List[str] = ["NormalizerWorker", "TranscriberWorker", "LLMWorker", "VaultWriterWorker"] # needed for readiness
+
+    # Retries: failed stages are retried with exponential backoff, then dead-lettered as ERROR
+    MAX_ATTEMPTS: int = 5
+    RETRY_BASE_DELAY: int = 30 # seconds before the first retry, doubled on each further attempt
+    RETRY_MAX_DELAY: int = 3600 # seconds
+
+    # Audio preprocessing
+    TRIM_SILENCE: bool = True
+    SILENCE_THRESHOLD_DB: float = -50.0
+
+    # Bulk ingest
+    BULK_INSERT_BATCH_SIZE: int = 500
+    BULK_AUDIO_MAX_ENTRIES: int = 1000 # per zip archive
+    BULK_AUDIO_MAX_UNCOMPRESSED_BYTES: int = 2 * 1024 ** 3 # total extracted size per zip archive
+
+    # Export
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # Inbox retention: "keep", "compact" (re-encode to Opus) or "delete" once a note is DONE
+    INBOX_RETENTION_POLICY: str = "compact"
+    INBOX_RETENTION_HOURS: int = 24
+
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, extra="ignore")
 
 settings = Settings()
@@ -10,7 +10,8 @@ import enum
 class NoteStatus(str, enum.Enum):
     """Status of a note in the processing pipeline"""
     UPLOADED = "UPLOADED"
+    NORMALIZED = "NORMALIZED"
     TRANSCRIBED = "TRANSCRIBED"
     PROCESSED = "PROCESSED"
     DONE = "DONE"
-    ERROR = "ERROR"
+    ERROR = "ERROR"  # Dead letter: a stage failed MAX_ATTEMPTS times (see metadata["failed_stage"])
@@ -1,15 +1,44 @@
+import json
+import zlib
 from datetime import datetime
 from typing import Optional, Any
-from sqlalchemy import String, Enum, DateTime, Text, JSON, func
-from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, Enum, DateTime, Text, JSON, Float, Integer, Boolean, ForeignKey, Index, LargeBinary, func, inspect
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 import uuid
 
 from infra.db import Base
 from core.enums import NoteStatus
 
+class CompressedText(TypeDecorator):
+    """Text stored zlib-compressed in a binary column."""
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return zlib.compress(value.encode("utf-8")) if value is not None else None
+
+    def process_result_value(self, value, dialect):
+        return zlib.decompress(value).decode("utf-8") if value is not None else None
+
+class CompressedJSON(TypeDecorator):
+    """JSON document stored zlib-compressed in a binary column."""
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return zlib.compress(json.dumps(value).encode("utf-8")) if value is not None else None
+
+    def process_result_value(self, value, dialect):
+        return json.loads(zlib.decompress(value)) if value is not None else None
+
 class Note(Base):
     __tablename__ = "notes"
+    __table_args__ = (
+        # Serves `tags @> '["tag"]'` containment filters
+        Index("ix_notes_tags", "tags", postgresql_using="gin", postgresql_ops={"tags": "jsonb_path_ops"}),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title: Mapped[Optional[str]] = mapped_column(String, nullable=True)
@@ -20,12 +49,77 @@ class Note(Base):
     
     source_filename: Mapped[str] = mapped_column(String)
     audio_path: Mapped[str] = mapped_column(String)
+    normalized_path: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    duration_seconds: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    audio_archived_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     
-    transcript: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     action_items: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
-    tags: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
+    tags: Mapped[Optional[Any]] = mapped_column(JSONB, nullable=True)
     metadata_: Mapped[Optional[Any]] = mapped_column("metadata", JSON, nullable=True) # metadata is reserved in SQLAlchemy
 
+    # Queue state for the current stage, reset whenever a stage succeeds
+    attempts: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    next_attempt_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    claimed_by: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True) # WorkerHeartbeat.worker_id
+    claimed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    # Transcripts live in a side table to keep this (hot, frequently polled) row narrow.
+    # Never lazy-loaded: queries that need it must use selectinload(Note.transcript_record).
+    transcript_record: Mapped[Optional["NoteTranscript"]] = relationship(
+        back_populates="note", lazy="raise", uselist=False, passive_deletes=True
+    )
+
+    @property
+    def transcript(self) -> Optional[str]:
+        """Transcript text, or None if absent or not loaded with this note."""
+        if "transcript_record" in inspect(self).unloaded or self.transcript_record is None:
+            return None
+        return self.transcript_record.content
+
+    @property
+    def segments(self) -> Optional[Any]:
+        """Per-segment timestamps, or None if absent or not loaded with this note."""
+        if "transcript_record" in inspect(self).unloaded or self.transcript_record is None:
+            return None
+        return self.transcript_record.segments
+
     def __repr__(self):
         return f"<Note id={self.id} title={self.title} status={self.status}>"
+
+class NoteTranscript(Base):
+    __tablename__ = "note_transcripts"
+
+    note_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("notes.id", ondelete="CASCADE"), primary_key=True)
+    content: Mapped[str] = mapped_column(CompressedText)
+    segments: Mapped[Optional[Any]] = mapped_column(CompressedJSON, nullable=True) # [{"start", "end", "text"}, ...]
+
+    note: Mapped[Note] = relationship(back_populates="transcript_record", lazy="raise")
+
+    def __repr__(self):
+        return f"<NoteTranscript note_id={self.note_id}>"
+
+class TagCount(Base):
+    """Number of notes carrying each tag, maintained incrementally (see infra.tags)."""
+    __tablename__ = "tag_counts"
+
+    tag: Mapped[str] = mapped_column(String, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0)
+
+    def __repr__(self):
+        return f"<TagCount tag={self.tag} count={self.count}>"
+
+class WorkerHeartbeat(Base):
+    """Liveness and model state reported periodically by each running worker process."""
+    __tablename__ = "worker_heartbeats"
+
+    worker_id: Mapped[str] = mapped_column(String, primary_key=True) # name:hostname:pid:uuid
+    name: Mapped[str] = mapped_column(String, index=True)
+    state: Mapped[str] = mapped_column(String) # loading, warming, ready, degraded
+    model_loaded: Mapped[bool] = mapped_column(Boolean, default=False)
+    warm: Mapped[bool] = mapped_column(Boolean, default=False)
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    last_heartbeat: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<WorkerHeartbeat worker_id={self.worker_id} state={self.state}>"
@@ -0,0 +1,145 @@
+"""
+Audio Storage Helpers
+
+Decoding, normalization and compaction of inbox audio files. All codec work
+is delegated to ffmpeg so the workers never have to care which container or
+codec a client uploaded.
+"""
+import asyncio
+import os
+from typing import List
+
+import numpy as np
+
+from core.config import settings
+
+# Whisper models expect 16 kHz mono input
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2  # bytes per signed 16-bit sample
+
+OPUS_BITRATE = "24k"
+
+# Trailing silence is trimmed by scanning the PCM backwards in chunks of this many samples
+TRIM_CHUNK_SAMPLES = SAMPLE_RATE * 10
+# Silence kept after the last sound, matching silenceremove's start_silence at the start
+TRIM_PADDING_SAMPLES = SAMPLE_RATE // 10
+
+
+class AudioProcessingError(Exception):
+    """Raised when ffmpeg fails to decode or encode an audio file."""
+
+
+async def _run_ffmpeg(args: List[str]) -> None:
+    process = await asyncio.create_subprocess_exec(
+        "ffmpeg", "-hide_banner", "-loglevel", "error", "-nostdin", "-y", *args,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await process.communicate()
+    if process.returncode != 0:
+        message = stderr.decode(errors="replace").strip()
+        raise AudioProcessingError(message or f"ffmpeg exited with code {process.returncode}")
+
+
+def _silence_filter() -> str:
+    # Resample first so the filter works on 16 kHz mono rather than the source format
+    return (
+        f"aresample={SAMPLE_RATE},aformat=channel_layouts=mono,"
+        "silenceremove=start_periods=1"
+        f":start_threshold={settings.SILENCE_THRESHOLD_DB}dB"
+        ":start_silence=0.1"
+    )
+
+
+def _trim_trailing_silence(pcm_path: str) -> None:
+    """
+    Truncate trailing silence from a normalized PCM file in place.
+
+    silenceremove only trims reliably at the start, and reversing the stream
+    in ffmpeg (areverse) buffers the whole clip in memory. Scanning the file
+    backwards keeps memory bounded however long the upload is.
+    """
+    size = os.path.getsize(pcm_path)
+    if size == 0:
+        return
+
+    threshold = int(32768 * 10 ** (settings.SILENCE_THRESHOLD_DB / 20))
+    samples = np.memmap(pcm_path, dtype=np.int16, mode="r")
+    total = len(samples)
+    keep = 0
+    end = total
+    while end > 0:
+        start = max(0, end - TRIM_CHUNK_SAMPLES)
+        loud = np.flatnonzero(np.abs(samples[start:end].astype(np.int32)) > threshold)
+        if loud.size:
+            keep = min(total, start + int(loud[-1]) + 1 + TRIM_PADDING_SAMPLES)
+            break
+        end = start
+    del samples
+
+    if keep < total:
+        os.truncate(pcm_path, keep * SAMPLE_WIDTH)
+
+
+def normalized_path_for(audio_path: str) -> str:
+    """Path of the cached 16 kHz mono PCM file for an inbox upload."""
+    return f"{os.path.splitext(audio_path)[0]}.pcm"
+
+
+def pcm_duration(pcm_path: str) -> float:
+    """Duration in seconds of a raw normalized PCM file."""
+    return os.path.getsize(pcm_path) / (SAMPLE_RATE * SAMPLE_WIDTH)
+
+
+async def normalize_audio(source_path: str, target_path: str) -> float:
+    """
+    Decode any input to raw 16 kHz mono s16le PCM, trimming leading and
+    trailing silence if enabled. Returns the duration of the result in seconds.
+    """
+    tmp_path = f"{target_path}.tmp"
+    args = ["-i", source_path, "-vn", "-ac", "1", "-ar", str(SAMPLE_RATE)]
+    if settings.TRIM_SILENCE:
+        args += ["-af", _silence_filter()]
+    args += ["-f", "s16le", "-acodec", "pcm_s16le", tmp_path]
+
+    try:
+        await _run_ffmpeg(args)
+        if settings.TRIM_SILENCE:
+            await asyncio.to_thread(_trim_trailing_silence, tmp_path)
+        os.replace(tmp_path, target_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return pcm_duration(target_path)
+
+
+def load_pcm(pcm_path: str) -> np.ndarray:
+    """Load a normalized PCM file as the float32 array faster-whisper accepts."""
+    samples = np.fromfile(pcm_path, dtype=np.int16)
+    return samples.astype(np.float32) / 32768.0
+
+
+async def compact_audio(source_path: str, target_path: str) -> None:
+    """
+    Re-encode audio to low-bitrate mono Opus for long-term storage.
+
+    Normalized `.pcm` sources are read as raw 16 kHz mono; anything else is
+    probed by ffmpeg as usual.
+    """
+    tmp_path = f"{target_path}.tmp"
+    args = []
+    if source_path.endswith(".pcm"):
+        args += ["-f", "s16le", "-ar", str(SAMPLE_RATE), "-ac", "1"]
+    args += [
+        "-i", source_path, "-vn", "-ac", "1",
+        "-c:a", "libopus", "-b:a", OPUS_BITRATE, "-application", "voip",
+        "-f", "ogg", tmp_path,
+    ]
+
+    try:
+        await _run_ffmpeg(args)
+        os.replace(tmp_path, target_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -1,5 +1,5 @@
 from infra.db import Base
-from core.models import Note
+from core.models import Note, NoteTranscript, TagCount, WorkerHeartbeat
 
 # Import all models here so Alembic can find them
-__all__ = ["Base", "Note"]
+__all__ = ["Base", "Note", "NoteTranscript", "TagCount", "WorkerHeartbeat"]
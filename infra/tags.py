@@ -0,0 +1,43 @@
+"""
+Tag Aggregates
+
+Keeps the tag_counts table up to date as notes gain tags, so tag statistics
+never need a full-table GROUP BY over notes.
+"""
+from collections import Counter
+from typing import Any, Iterable
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import TagCount
+
+
+def count_tags(tag_lists: Iterable[Any]) -> Counter:
+    """Count each distinct string tag once per note."""
+    counts: Counter = Counter()
+    for tags in tag_lists:
+        if isinstance(tags, list):
+            counts.update({tag for tag in tags if isinstance(tag, str)})
+    return counts
+
+
+async def increment_tag_counts(session: AsyncSession, tag_lists: Iterable[Any]) -> None:
+    """
+    Add the tags of newly tagged notes to the aggregate.
+
+    Runs in the caller's transaction so the counts commit (or roll back)
+    together with the notes themselves.
+    """
+    counts = count_tags(tag_lists)
+    if not counts:
+        return
+
+    # Sorted so concurrent writers lock aggregate rows in the same order
+    rows = [{"tag": tag, "count": counts[tag]} for tag in sorted(counts)]
+    stmt = insert(TagCount).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TagCount.tag],
+        set_={"count": TagCount.count + stmt.excluded["count"]},
+    )
+    await session.execute(stmt)
@@ -4,7 +4,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from core.config import settings
 from core.logging import setup_logging, get_logger
-from infra.db import engine, Base
+from infra.db import engine
 from api.routers import api_router
 
 setup_logging()
@@ -15,9 +15,7 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up Pi-Hub Backend...")
     
-    # Create tables (for MVP simplicity - in prod use Alembic)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Tables are created once by `init-db` (scripts/init_db.py), not on every boot
     
     yield
     
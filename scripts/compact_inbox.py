@@ -0,0 +1,169 @@
+"""
+Inbox retention job.
+
+Compacts or deletes the audio of notes that finished processing more than
+INBOX_RETENTION_HOURS ago, according to INBOX_RETENTION_POLICY:
+
+- keep:    leave the original upload, only drop the normalized PCM cache
+- compact: re-encode to low-bitrate Opus and drop the original and cache
+- delete:  remove all audio for the note
+
+Notes dead-lettered as ERROR keep their original upload so they can still
+be retried, but their normalized PCM cache is dropped after the same delay.
+
+Intended to be run periodically (e.g. from cron) via `compact-inbox`.
+"""
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.logging import setup_logging, get_logger
+from core.models import Note, NoteStatus
+from infra.audio import compact_audio
+from infra.db import AsyncSessionLocal, engine
+
+logger = get_logger(__name__)
+
+BATCH_SIZE = 100
+POLICIES = ("keep", "compact", "delete")
+
+
+def _remove(path: str) -> None:
+    if path and os.path.exists(path):
+        os.remove(path)
+
+
+async def _apply_policy(note: Note, policy: str) -> List[str]:
+    """
+    Update the note for the retention policy, creating any compacted file.
+    Returns the files that become obsolete; the caller removes them only after
+    the new paths are committed.
+    """
+    obsolete = [note.normalized_path] if note.normalized_path else []
+
+    if policy == "compact":
+        opus_path = f"{os.path.splitext(note.audio_path)[0]}.opus"
+        if opus_path != note.audio_path:
+            # The normalized cache is already decoded and trimmed, so prefer it as the source
+            if note.normalized_path and os.path.exists(note.normalized_path):
+                source = note.normalized_path
+            else:
+                source = note.audio_path
+            await compact_audio(source, opus_path)
+            obsolete.append(note.audio_path)
+            note.audio_path = opus_path
+    elif policy == "delete":
+        obsolete.append(note.audio_path)
+        note.audio_path = ""
+
+    note.normalized_path = None
+    note.audio_archived_at = datetime.now(timezone.utc)
+    return obsolete
+
+
+async def _drop_error_caches(session: AsyncSession, cutoff: datetime) -> int:
+    """Remove the normalized PCM cache of ERROR notes. Returns the number handled."""
+    handled = 0
+    while True:
+        query = (
+            select(Note)
+            .where(
+                Note.status == NoteStatus.ERROR,
+                Note.normalized_path.is_not(None),
+                Note.updated_at < cutoff,
+            )
+            .order_by(Note.updated_at)
+            .limit(BATCH_SIZE)
+        )
+        result = await session.execute(query)
+        notes = result.scalars().all()
+        if not notes:
+            return handled
+
+        for note in notes:
+            # A retry falls back to decoding the original upload
+            obsolete = note.normalized_path
+            note.normalized_path = None
+            session.add(note)
+            await session.commit()
+            _remove(obsolete)
+            handled += 1
+
+
+async def compact_inbox() -> int:
+    """Apply the retention policy to all eligible notes. Returns the number handled."""
+    policy = settings.INBOX_RETENTION_POLICY
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown INBOX_RETENTION_POLICY {policy!r}, expected one of {POLICIES}")
+
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=settings.INBOX_RETENTION_HOURS)
+    handled = 0
+    # Notes that failed this run; they stay unarchived and eligible for a later run
+    failed_ids = set()
+
+    async with AsyncSessionLocal() as session:
+        while True:
+            query = (
+                select(Note)
+                .where(
+                    Note.status == NoteStatus.DONE,
+                    Note.audio_path != "",
+                    Note.audio_archived_at.is_(None),
+                    Note.updated_at < cutoff,
+                    Note.id.not_in(failed_ids),
+                )
+                .order_by(Note.updated_at)
+                .limit(BATCH_SIZE)
+            )
+            result = await session.execute(query)
+            notes = result.scalars().all()
+            if not notes:
+                break
+
+            for note in notes:
+                try:
+                    obsolete = await _apply_policy(note, policy)
+                except Exception as e:
+                    # _apply_policy only touches the note once the new file exists, so the
+                    # files and archive state are untouched and the next run retries
+                    logger.error(f"Retention failed for {note.id}: {e}")
+                    note.metadata_ = {**(note.metadata_ or {}), "retention_error": str(e)}
+                    session.add(note)
+                    await session.commit()
+                    failed_ids.add(note.id)
+                    continue
+
+                session.add(note)
+                # Commit per note, and before removing anything, so the DB never points at deleted files
+                await session.commit()
+                for path in obsolete:
+                    _remove(path)
+                handled += 1
+
+        dropped = await _drop_error_caches(session, cutoff)
+
+    logger.info(f"Inbox retention ({policy}) handled {handled} notes")
+    if dropped:
+        logger.info(f"Dropped the normalized cache of {dropped} ERROR notes")
+    return handled
+
+
+async def main():
+    try:
+        await compact_inbox()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    setup_logging()
+    asyncio.run(main())
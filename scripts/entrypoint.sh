@@ -5,6 +5,9 @@ set -e
 if [ "$1" = 'api' ]; then
     echo "Starting API..."
     exec fastapi run main.py --port $PORT
+elif [ "$1" = 'worker-normalizer' ]; then
+    echo "Starting Normalizer Worker..."
+    exec python -m workers.normalizer
 elif [ "$1" = 'worker-transcriber' ]; then
     echo "Starting Transcriber Worker..."
     exec python -m workers.transcriber
@@ -14,6 +17,12 @@ elif [ "$1" = 'worker-llm' ]; then
 elif [ "$1" = 'worker-vault' ]; then
     echo "Starting Vault Writer Worker..."
     exec python -m workers.vault_writer
+elif [ "$1" = 'init-db' ]; then
+    echo "Initializing database..."
+    exec python scripts/init_db.py
+elif [ "$1" = 'compact-inbox' ]; then
+    echo "Running inbox retention..."
+    exec python scripts/compact_inbox.py
 else
     exec "$@"
 fi
@@ -0,0 +1,38 @@
+"""
+Create all database tables.
+
+Run once before starting the API and workers (the `init-db` entrypoint
+command / db-init compose service) so the API doesn't pay for schema
+checks on every boot. Existing tables are left untouched.
+"""
+import asyncio
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.logging import setup_logging, get_logger
+from infra.base import Base
+from infra.db import engine
+
+logger = get_logger(__name__)
+
+
+async def init_db():
+    # Create tables (for MVP simplicity - in prod use Alembic)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    logger.info("Database tables created")
+
+
+async def main():
+    try:
+        await init_db()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    setup_logging()
+    asyncio.run(main())
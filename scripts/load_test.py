@@ -0,0 +1,271 @@
+"""
+API load-test harness.
+
+Drives the note endpoints with many concurrent clients and reports
+throughput, p50/p95/p99 latency per operation and database pool checkout
+time. Operations:
+
+- upload: POST /notes/audio with a synthetic WAV file
+- text:   POST /notes/text
+- list:   GET /notes (random page)
+- read:   GET /notes/{id} (random known note)
+
+By default the FastAPI app is run in-process against the configured
+DATABASE_URL (point it at a local, disposable Postgres; tables must exist,
+see scripts/init_db.py) and INBOX_DIR must be writable. Pass --url to hit a
+running server instead; pool checkout time is only measured in-process.
+
+Example:
+    python scripts/load_test.py --concurrency 100 --duration 30 \\
+        --mix upload=1,text=2,list=4,read=8
+"""
+import argparse
+import asyncio
+import io
+import json
+import logging
+import math
+import os
+import random
+import struct
+import sys
+import time
+import wave
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+API_PREFIX = "/api/notes"
+OPERATIONS = ("upload", "text", "list", "read")
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """Parse `op=weight,...` into a weight per operation."""
+    mix = {}
+    for part in value.split(","):
+        op, _, weight = part.partition("=")
+        op = op.strip()
+        if op not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"Unknown operation {op!r}, expected one of {OPERATIONS}")
+        mix[op] = float(weight or 1)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("Mix must give at least one operation a positive weight")
+    return mix
+
+
+def synthetic_wav(seconds: float, sample_rate: int = 16000) -> bytes:
+    """A mono 16-bit WAV of a tone with some noise, roughly speech-sized."""
+    frames = bytearray()
+    for i in range(int(seconds * sample_rate)):
+        sample = 0.3 * math.sin(2 * math.pi * 220 * i / sample_rate) + random.uniform(-0.05, 0.05)
+        frames += struct.pack("<h", int(sample * 32767))
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(bytes(frames))
+    return buffer.getvalue()
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    ordered = sorted(values)
+    return {
+        "p50_ms": percentile(ordered, 50) * 1000,
+        "p95_ms": percentile(ordered, 95) * 1000,
+        "p99_ms": percentile(ordered, 99) * 1000,
+        "max_ms": (ordered[-1] if ordered else 0.0) * 1000,
+    }
+
+
+class PoolTimer:
+    """Records how long each connection checkout from the SQLAlchemy pool takes."""
+
+    def __init__(self, engine):
+        self.waits: List[float] = []
+        self.pool = engine.sync_engine.pool
+        original_connect = self.pool.connect
+
+        def timed_connect():
+            start = time.perf_counter()
+            try:
+                return original_connect()
+            finally:
+                self.waits.append(time.perf_counter() - start)
+
+        self.pool.connect = timed_connect
+
+
+class LoadTest:
+    def __init__(self, client: httpx.AsyncClient, args: argparse.Namespace):
+        self.client = client
+        self.args = args
+        self.audio = synthetic_wav(args.audio_seconds)
+        self.note_ids: List[str] = []
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.ops = list(args.mix)
+        self.weights = [args.mix[op] for op in self.ops]
+
+    async def request(self, op: str) -> httpx.Response:
+        if op == "upload":
+            return await self.client.post(
+                f"{API_PREFIX}/audio",
+                files={"file": ("loadtest.wav", self.audio, "audio/wav")},
+                data={"tags": ["loadtest"]},
+            )
+        if op == "text":
+            return await self.client.post(
+                f"{API_PREFIX}/text",
+                json={"content": "Load test note. " * 20, "tags": ["loadtest"]},
+            )
+        if op == "list":
+            return await self.client.get(
+                f"{API_PREFIX}/",
+                params={"skip": random.randint(0, 10) * self.args.page_size, "limit": self.args.page_size},
+            )
+        return await self.client.get(f"{API_PREFIX}/{random.choice(self.note_ids)}")
+
+    async def seed(self):
+        """Create notes up front so reads have something to hit."""
+        for _ in range(self.args.seed):
+            response = await self.request("text")
+            response.raise_for_status()
+            self.note_ids.append(response.json()["id"])
+
+    async def client_loop(self, deadline: float):
+        while time.perf_counter() < deadline:
+            op = random.choices(self.ops, self.weights)[0]
+            if op == "read" and not self.note_ids:
+                op = "text"
+
+            start = time.perf_counter()
+            try:
+                response = await self.request(op)
+                elapsed = time.perf_counter() - start
+                if response.status_code >= 400:
+                    self.errors[op] += 1
+                    continue
+            except httpx.HTTPError:
+                self.errors[op] += 1
+                continue
+
+            self.latencies[op].append(elapsed)
+            if op in ("upload", "text"):
+                self.note_ids.append(response.json()["id"])
+
+    async def run(self) -> float:
+        await self.seed()
+        start = time.perf_counter()
+        deadline = start + self.args.duration
+        await asyncio.gather(*(self.client_loop(deadline) for _ in range(self.args.concurrency)))
+        return time.perf_counter() - start
+
+
+def build_report(test: LoadTest, elapsed: float, pool_timer: Optional[PoolTimer]) -> dict:
+    report = {
+        "concurrency": test.args.concurrency,
+        "duration_s": elapsed,
+        "operations": {},
+    }
+    all_latencies: List[float] = []
+    for op in test.ops:
+        latencies = test.latencies[op]
+        all_latencies.extend(latencies)
+        report["operations"][op] = {
+            "requests": len(latencies),
+            "errors": test.errors[op],
+            "throughput_rps": len(latencies) / elapsed,
+            **summarize(latencies),
+        }
+    report["total"] = {
+        "requests": len(all_latencies),
+        "errors": sum(test.errors.values()),
+        "throughput_rps": len(all_latencies) / elapsed,
+        **summarize(all_latencies),
+    }
+    if pool_timer is not None:
+        report["db_pool_checkout"] = {"checkouts": len(pool_timer.waits), **summarize(pool_timer.waits)}
+    return report
+
+
+def print_report(report: dict):
+    print(f"\nConcurrency {report['concurrency']}, {report['duration_s']:.1f}s\n")
+    header = f"{'operation':<10} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    print(header)
+    print("-" * len(header))
+    rows = list(report["operations"].items()) + [("total", report["total"])]
+    for op, stats in rows:
+        print(
+            f"{op:<10} {stats['requests']:>9} {stats['errors']:>7} {stats['throughput_rps']:>9.1f} "
+            f"{stats['p50_ms']:>9.1f} {stats['p95_ms']:>9.1f} {stats['p99_ms']:>9.1f} {stats['max_ms']:>9.1f}"
+        )
+    pool = report.get("db_pool_checkout")
+    if pool:
+        print(
+            f"\nDB pool checkout ({pool['checkouts']} checkouts): p50 {pool['p50_ms']:.1f} ms, "
+            f"p95 {pool['p95_ms']:.1f} ms, p99 {pool['p99_ms']:.1f} ms, max {pool['max_ms']:.1f} ms"
+        )
+
+
+async def main(args: argparse.Namespace):
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    pool_timer = None
+
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, limits=limits, timeout=args.timeout)
+    else:
+        from main import app
+        from infra.db import engine
+
+        pool_timer = PoolTimer(engine)
+        transport = httpx.ASGITransport(app=app)
+        client = httpx.AsyncClient(transport=transport, base_url="http://loadtest", limits=limits, timeout=args.timeout)
+
+    try:
+        async with client:
+            test = LoadTest(client, args)
+            elapsed = await test.run()
+    finally:
+        if not args.url:
+            await engine.dispose()
+
+    report = build_report(test, elapsed, pool_timer)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load-test the notes API.")
+    parser.add_argument("--url", help="Base URL of a running server (default: run the app in-process)")
+    parser.add_argument("--concurrency", type=int, default=100, help="Concurrent clients (default: 100)")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to run (default: 30)")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("upload=1,text=2,list=4,read=8"),
+                        help="Operation weights, e.g. upload=1,text=2,list=4,read=8")
+    parser.add_argument("--seed", type=int, default=50, help="Text notes to create before the run (default: 50)")
+    parser.add_argument("--audio-seconds", type=float, default=5, help="Length of the synthetic upload (default: 5)")
+    parser.add_argument("--page-size", type=int, default=100, help="Page size for list requests (default: 100)")
+    parser.add_argument("--timeout", type=float, default=60, help="Per-request timeout in seconds (default: 60)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    # The app configures INFO logging on import; per-request logs would swamp the report
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    asyncio.run(main(args))
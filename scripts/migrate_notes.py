@@ -0,0 +1,72 @@
+"""
+One-off migration: add the pipeline columns and statuses that newer code
+expects to an existing `notes` table.
+
+create_all (scripts/init_db.py) never alters existing tables or enum types,
+so databases created before these columns were introduced must run this
+once. Safe to re-run.
+"""
+import asyncio
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+
+from core.logging import setup_logging, get_logger
+from infra.base import Base
+from infra.db import engine
+
+logger = get_logger(__name__)
+
+COLUMNS = [
+    # Audio normalization and inbox retention
+    "normalized_path VARCHAR",
+    "duration_seconds DOUBLE PRECISION",
+    "audio_archived_at TIMESTAMP WITH TIME ZONE",
+    # Retry and claim state
+    "attempts INTEGER NOT NULL DEFAULT 0",
+    "next_attempt_at TIMESTAMP WITH TIME ZONE",
+    "claimed_by VARCHAR",
+    "claimed_at TIMESTAMP WITH TIME ZONE",
+]
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_notes_claimed_by ON notes (claimed_by)",
+]
+
+STATUSES = [
+    ("NORMALIZED", "UPLOADED"),  # (new value, value it follows)
+]
+
+
+async def migrate_notes() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+        for column in COLUMNS:
+            await conn.execute(text(f"ALTER TABLE notes ADD COLUMN IF NOT EXISTS {column}"))
+        for index in INDEXES:
+            await conn.execute(text(index))
+
+    # New enum values can't be used in the transaction that adds them, so add them outside one
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for value, after in STATUSES:
+            await conn.execute(text(f"ALTER TYPE notestatus ADD VALUE IF NOT EXISTS '{value}' AFTER '{after}'"))
+
+    logger.info("notes table migrated")
+
+
+async def main():
+    try:
+        await migrate_notes()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    setup_logging()
+    asyncio.run(main())
@@ -0,0 +1,59 @@
+"""
+One-off migration: convert `notes.tags` to JSONB with a GIN index and
+rebuild the `tag_counts` aggregate from existing notes.
+
+Safe to re-run; the aggregate is rebuilt from scratch each time, so this
+can also be used to repair counts that drifted (e.g. after manual SQL).
+"""
+import asyncio
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+
+from core.logging import setup_logging, get_logger
+from infra.base import Base
+from infra.db import engine
+
+logger = get_logger(__name__)
+
+
+async def migrate_tags() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+        await conn.execute(text(
+            "ALTER TABLE notes ALTER COLUMN tags TYPE jsonb USING tags::jsonb"
+        ))
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_notes_tags ON notes USING gin (tags jsonb_path_ops)"
+        ))
+
+        # Blocks concurrent tag writers until the rebuild commits
+        await conn.execute(text("LOCK TABLE tag_counts IN EXCLUSIVE MODE"))
+        await conn.execute(text("DELETE FROM tag_counts"))
+        await conn.execute(text(
+            "INSERT INTO tag_counts (tag, count) "
+            "SELECT tag, count(DISTINCT id) FROM notes "
+            "CROSS JOIN LATERAL jsonb_array_elements_text("
+            "CASE WHEN jsonb_typeof(tags) = 'array' THEN tags ELSE '[]'::jsonb END"
+            ") AS tag "
+            "GROUP BY tag"
+        ))
+
+    logger.info("notes.tags migrated to JSONB and tag_counts rebuilt")
+
+
+async def main():
+    try:
+        await migrate_tags()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    setup_logging()
+    asyncio.run(main())
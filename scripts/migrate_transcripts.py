@@ -0,0 +1,69 @@
+"""
+One-off migration: move transcripts out of `notes.transcript` into the
+compressed `note_transcripts` side table, then drop the old column.
+
+Safe to re-run; it does nothing once the column is gone.
+"""
+import asyncio
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import Text, insert, inspect, text
+from sqlalchemy.dialects.postgresql import UUID
+
+from core.logging import setup_logging, get_logger
+from core.models import NoteTranscript
+from infra.db import Base, engine
+
+logger = get_logger(__name__)
+
+BATCH_SIZE = 1000
+
+
+def _has_transcript_column(sync_conn) -> bool:
+    columns = inspect(sync_conn).get_columns("notes")
+    return any(column["name"] == "transcript" for column in columns)
+
+
+async def migrate_transcripts() -> int:
+    """Copy legacy transcripts into note_transcripts. Returns the number moved."""
+    moved = 0
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+        if not await conn.run_sync(_has_transcript_column):
+            logger.info("notes.transcript already migrated, nothing to do")
+            return 0
+
+        result = await conn.stream(text(
+            "SELECT n.id, n.transcript FROM notes n "
+            "LEFT JOIN note_transcripts t ON t.note_id = n.id "
+            "WHERE n.transcript IS NOT NULL AND t.note_id IS NULL"
+        ).columns(id=UUID(as_uuid=True), transcript=Text))
+        async for partition in result.partitions(BATCH_SIZE):
+            rows = [{"note_id": row.id, "content": row.transcript} for row in partition]
+            await conn.execute(insert(NoteTranscript), rows)
+            moved += len(rows)
+
+    # Separate transaction: the cursor above keeps notes in use until its transaction ends
+    async with engine.begin() as conn:
+        await conn.execute(text("ALTER TABLE notes DROP COLUMN transcript"))
+
+    logger.info(f"Moved {moved} transcripts to note_transcripts")
+    return moved
+
+
+async def main():
+    try:
+        await migrate_transcripts()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    setup_logging()
+    asyncio.run(main())
@@ -1,11 +1,21 @@
 import asyncio
 import logging
+import os
+import random
+import signal
+import socket
+import uuid
 from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, delete, exists, func, or_
+from sqlalchemy.dialects.postgresql import insert
 
 from infra.db import AsyncSessionLocal
+from core.config import settings
+from core.enums import NoteStatus
+from core.models import Note, WorkerHeartbeat
 from core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -15,18 +25,270 @@ class BaseWorker(ABC):
         self.name = name
         self.poll_interval = poll_interval
         self.running = True
+        # hostname and pid repeat across container restarts, so add a per-process id
+        self.worker_id = f"{name}:{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}"
+        self.state = "loading"
+        self.model_loaded = False
+        self.warm = False
 
-    async def run(self):
-        logger.info(f"Starting worker: {self.name}")
+    def load_model(self) -> bool:
+        """
+        Load any models the worker needs. Runs in a thread after the heartbeat
+        has started, so a slow load shows up as "loading" rather than dead.
+        Returns True if the worker has what it needs to process items.
+        """
+        return True
+
+    def warm_up(self) -> None:
+        """
+        Run a throwaway inference so the first real item doesn't pay one-off
+        initialization costs (kernel selection, memory mapping, caches).
+        """
+        pass
+
+    async def _send_heartbeat(self):
+        values = {
+            "name": self.name,
+            "state": self.state,
+            "model_loaded": self.model_loaded,
+            "warm": self.warm,
+            "last_heartbeat": func.now(),
+        }
+        async with AsyncSessionLocal() as session:
+            stmt = insert(WorkerHeartbeat).values(worker_id=self.worker_id, **values)
+            stmt = stmt.on_conflict_do_update(index_elements=[WorkerHeartbeat.worker_id], set_=values)
+            await session.execute(stmt)
+            await session.commit()
+
+    async def _set_state(self, state: str):
+        self.state = state
+        try:
+            await self._send_heartbeat()
+        except Exception as e:
+            logger.warning(f"Heartbeat failed for {self.worker_id}: {e}")
+
+    async def _heartbeat_loop(self):
         while self.running:
+            await asyncio.sleep(settings.WORKER_HEARTBEAT_INTERVAL)
+            try:
+                await self._send_heartbeat()
+            except Exception as e:
+                logger.warning(f"Heartbeat failed for {self.worker_id}: {e}")
             try:
-                async with AsyncSessionLocal() as session:
-                    processed = await self.process_next(session)
-                    if not processed:
-                        await asyncio.sleep(self.poll_interval)
+                await self.reap_stale_claims()
             except Exception as e:
-                logger.error(f"Error in worker {self.name}: {e}", exc_info=True)
-                await asyncio.sleep(self.poll_interval)
+                logger.warning(f"Reaping stale claims failed: {e}")
+
+    async def claim_next(self, session: AsyncSession, status: NoteStatus, *options) -> Optional[Note]:
+        """
+        Claim the oldest note in `status` that is due for an attempt.
+
+        SKIP LOCKED lets several workers poll the same stage without handing
+        out the same note twice. The claim is committed immediately, so no
+        transaction is held open during inference.
+        """
+        query = (
+            select(Note)
+            .options(*options)
+            .where(
+                Note.status == status,
+                Note.claimed_by.is_(None),
+                or_(Note.next_attempt_at.is_(None), Note.next_attempt_at <= func.now()),
+            )
+            .order_by(Note.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True, of=Note)
+        )
+        result = await session.execute(query)
+        note = result.scalar_one_or_none()
+        if not note:
+            return None
+
+        note.claimed_by = self.worker_id
+        note.claimed_at = datetime.now(timezone.utc)
+        await session.commit()
+        return note
+
+    def complete(self, note: Note, status: NoteStatus):
+        """Advance a claimed note to the next stage and reset its retry state."""
+        note.status = status
+        note.attempts = 0
+        note.next_attempt_at = None
+        note.claimed_by = None
+        note.claimed_at = None
+
+    @staticmethod
+    def retry_delay(attempts: int) -> timedelta:
+        """Exponential backoff with jitter for the given number of failed attempts."""
+        delay = min(settings.RETRY_BASE_DELAY * 2 ** (attempts - 1), settings.RETRY_MAX_DELAY)
+        return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+    @staticmethod
+    def record_failure(note: Note, error: str):
+        """
+        Count a failed attempt at the note's current stage and release its claim.
+
+        The note is scheduled for a retry after a backoff delay, or moved to
+        ERROR (the dead-letter state) once MAX_ATTEMPTS is reached. Errors are
+        appended to metadata rather than replacing it.
+        """
+        now = datetime.now(timezone.utc)
+        note.attempts = (note.attempts or 0) + 1
+
+        metadata = dict(note.metadata_ or {})
+        metadata["error"] = error
+        metadata["errors"] = list(metadata.get("errors", [])) + [{
+            "stage": note.status.value,
+            "attempt": note.attempts,
+            "error": error,
+            "at": now.isoformat(),
+        }]
+
+        if note.attempts >= settings.MAX_ATTEMPTS:
+            metadata["failed_stage"] = note.status.value
+            note.status = NoteStatus.ERROR
+            note.next_attempt_at = None
+        else:
+            note.next_attempt_at = now + BaseWorker.retry_delay(note.attempts)
+
+        note.metadata_ = metadata
+        note.claimed_by = None
+        note.claimed_at = None
+
+    async def fail(self, session: AsyncSession, note: Note, error: Exception):
+        """Roll back a failed attempt and record it on the note."""
+        # Discard partial results of the attempt, then reload the note's committed state
+        await session.rollback()
+        await session.refresh(note)
+        self.record_failure(note, str(error))
+        session.add(note)
+        await session.commit()
+
+    async def reap_stale_claims(self) -> int:
+        """
+        Re-queue notes claimed by workers whose heartbeat has expired (e.g. a
+        worker killed mid-inference). This counts as a failed attempt, so a
+        note that keeps crashing its worker is eventually dead-lettered.
+
+        Heartbeat rows of workers that died without a clean shutdown are
+        deleted once WORKER_HEARTBEAT_RETENTION has passed and none of their
+        claims remain, so they don't pile up across restarts.
+        """
+        timeout = timedelta(seconds=settings.WORKER_HEARTBEAT_TIMEOUT)
+        live_claimant = exists().where(
+            WorkerHeartbeat.worker_id == Note.claimed_by,
+            WorkerHeartbeat.last_heartbeat >= func.now() - timeout,
+        )
+        query = (
+            select(Note)
+            .where(
+                Note.claimed_by.is_not(None),
+                Note.claimed_at < func.now() - timeout,
+                ~live_claimant,
+            )
+            .with_for_update(skip_locked=True, of=Note)
+        )
+
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(query)
+            notes = result.scalars().all()
+            for note in notes:
+                logger.warning(f"Re-queuing note {note.id} abandoned by {note.claimed_by}")
+                self.record_failure(note, f"Worker {note.claimed_by} stopped responding")
+                session.add(note)
+            await session.commit()
+
+            retention = timedelta(seconds=settings.WORKER_HEARTBEAT_RETENTION)
+            has_claims = exists().where(Note.claimed_by == WorkerHeartbeat.worker_id)
+            await session.execute(
+                delete(WorkerHeartbeat).where(
+                    WorkerHeartbeat.last_heartbeat < func.now() - retention,
+                    ~has_claims,
+                )
+            )
+            await session.commit()
+
+        return len(notes)
+
+    async def release_claims(self, error: str) -> int:
+        """
+        Record a failed attempt on any note this worker still has claimed, e.g.
+        when process_next raised after claiming, so it doesn't wait for the reaper.
+        """
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(Note).where(Note.claimed_by == self.worker_id).with_for_update(of=Note)
+            )
+            notes = result.scalars().all()
+            for note in notes:
+                logger.warning(f"Releasing claim on note {note.id}")
+                self.record_failure(note, error)
+                session.add(note)
+            await session.commit()
+
+        return len(notes)
+
+    async def _clear_heartbeat(self):
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(delete(WorkerHeartbeat).where(WorkerHeartbeat.worker_id == self.worker_id))
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"Could not clear heartbeat for {self.worker_id}: {e}")
+
+    def stop(self):
+        logger.info(f"Stopping worker: {self.name}")
+        self.running = False
+
+    async def run(self):
+        logger.info(f"Starting worker: {self.name}")
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self.stop)
+
+        await self._set_state("loading")
+        heartbeat = asyncio.create_task(self._heartbeat_loop())
+        try:
+            self.model_loaded = await asyncio.to_thread(self.load_model)
+            # A stop requested during a slow load shouldn't be followed by warm-up or "ready"
+            if not self.running:
+                return
+
+            if self.model_loaded:
+                await self._set_state("warming")
+                try:
+                    await asyncio.to_thread(self.warm_up)
+                    self.warm = True
+                except Exception as e:
+                    logger.warning(f"Warm-up failed for {self.name}: {e}")
+                if not self.running:
+                    return
+
+            if self.model_loaded:
+                await self._set_state("ready")
+                logger.info(f"Worker ready: {self.name}")
+            else:
+                # Keep polling (e.g. the LLM worker's fallback), but don't report a broken stage as ready
+                await self._set_state("degraded")
+                logger.warning(f"Worker running degraded, model not loaded: {self.name}")
+
+            while self.running:
+                try:
+                    async with AsyncSessionLocal() as session:
+                        processed = await self.process_next(session)
+                        if not processed:
+                            await asyncio.sleep(self.poll_interval)
+                except Exception as e:
+                    logger.error(f"Error in worker {self.name}: {e}", exc_info=True)
+                    try:
+                        await self.release_claims(str(e))
+                    except Exception as release_error:
+                        logger.warning(f"Could not release claims for {self.worker_id}: {release_error}")
+                    await asyncio.sleep(self.poll_interval)
+        finally:
+            self.running = False
+            heartbeat.cancel()
+            await self._clear_heartbeat()
 
     @abstractmethod
     async def process_next(self, session: AsyncSession) -> bool:
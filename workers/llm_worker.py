@@ -1,12 +1,13 @@
 import asyncio
 import json
-from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 # from llama_cpp import Llama # Commented out to avoid import error if not installed locally, but code assumes it's there in Docker
 
 from core.config import settings
 from core.models import Note, NoteStatus
 from core.logging import get_logger
+from infra.tags import increment_tag_counts
 from workers.base import BaseWorker
 
 logger = get_logger(__name__)
@@ -14,6 +15,9 @@ logger = get_logger(__name__)
 class LLMWorker(BaseWorker):
     def __init__(self):
         super().__init__("LLMWorker")
+        self.llm = None
+
+    def load_model(self) -> bool:
         # Mocking Llama for now if not available, or use real one
         try:
             from llama_cpp import Llama
@@ -29,11 +33,13 @@ class LLMWorker(BaseWorker):
         except Exception as e:
             logger.warning(f"Could not load LLM model: {e}. Ensure model exists at {settings.LLM_MODEL_PATH}")
             self.llm = None
+        return self.llm is not None
+
+    def warm_up(self) -> None:
+        self.llm("[INST] Hello [/INST]", max_tokens=1, echo=False)
 
     async def process_next(self, session: AsyncSession) -> bool:
-        query = select(Note).where(Note.status == NoteStatus.TRANSCRIBED).order_by(Note.created_at).limit(1)
-        result = await session.execute(query)
-        note = result.scalar_one_or_none()
+        note = await self.claim_next(session, NoteStatus.TRANSCRIBED, selectinload(Note.transcript_record))
 
         if not note:
             return False
@@ -45,7 +51,7 @@ class LLMWorker(BaseWorker):
             logger.warning("LLM not loaded, skipping actual inference.")
             note.summary = "Summary generation skipped (LLM not loaded)."
             note.action_items = ["Check LLM configuration"]
-            note.status = NoteStatus.PROCESSED
+            self.complete(note, NoteStatus.PROCESSED)
             session.add(note)
             await session.commit()
             return True
@@ -102,6 +108,7 @@ Do not include any text before or after the JSON. [/INST]"""
                     # Only update tags if missing or empty
                     if not note.tags:
                         note.tags = data.get("tags", [])
+                        await increment_tag_counts(session, [note.tags])
                 else:
                     note.summary = text_response
                     note.action_items = []
@@ -109,7 +116,7 @@ Do not include any text before or after the JSON. [/INST]"""
                 logger.warning("Failed to parse LLM JSON response, saving raw text.")
                 note.summary = text_response
             
-            note.status = NoteStatus.PROCESSED
+            self.complete(note, NoteStatus.PROCESSED)
             session.add(note)
             await session.commit()
             logger.info(f"LLM processing complete for: {note.id}")
@@ -117,10 +124,7 @@ Do not include any text before or after the JSON. [/INST]"""
 
         except Exception as e:
             logger.error(f"LLM processing failed for {note.id}: {e}")
-            note.status = NoteStatus.ERROR
-            note.metadata_ = {"error": str(e)}
-            session.add(note)
-            await session.commit()
+            await self.fail(session, note, e)
             return True
 
 if __name__ == "__main__":
@@ -0,0 +1,46 @@
+import asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import NoteStatus
+from core.logging import get_logger
+from infra.audio import normalize_audio, normalized_path_for
+from workers.base import BaseWorker
+
+logger = get_logger(__name__)
+
+class NormalizerWorker(BaseWorker):
+    def __init__(self):
+        super().__init__("NormalizerWorker")
+
+    async def process_next(self, session: AsyncSession) -> bool:
+        # Claim next UPLOADED note
+        note = await self.claim_next(session, NoteStatus.UPLOADED)
+
+        if not note:
+            return False
+
+        logger.info(f"Normalizing audio for note: {note.id}")
+
+        try:
+            # Decode once to 16 kHz mono PCM so transcription attempts skip decoding/resampling
+            pcm_path = normalized_path_for(note.audio_path)
+            duration = await normalize_audio(note.audio_path, pcm_path)
+
+            note.normalized_path = pcm_path
+            note.duration_seconds = duration
+            self.complete(note, NoteStatus.NORMALIZED)
+            session.add(note)
+            await session.commit()
+            logger.info(f"Normalization complete for: {note.id} ({duration:.1f}s)")
+            return True
+
+        except Exception as e:
+            logger.error(f"Normalization failed for {note.id}: {e}")
+            await self.fail(session, note, e)
+            return True
+
+if __name__ == "__main__":
+    from core.logging import setup_logging
+    setup_logging()
+    worker = NormalizerWorker()
+    asyncio.run(worker.run())
@@ -1,11 +1,12 @@
 import asyncio
-from faster_whisper import WhisperModel
-from sqlalchemy import select
+import os
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import settings
-from core.models import Note, NoteStatus
+from core.models import NoteStatus, NoteTranscript
 from core.logging import get_logger
+from infra.audio import load_pcm
 from workers.base import BaseWorker
 
 logger = get_logger(__name__)
@@ -13,16 +14,32 @@ logger = get_logger(__name__)
 class TranscriberWorker(BaseWorker):
     def __init__(self):
         super().__init__("TranscriberWorker")
-        # Initialize model lazily or here if memory permits
+        self.model = None
+
+    def load_model(self) -> bool:
+        # Imported here so the process starts (and heartbeats) before the heavy import
+        from faster_whisper import WhisperModel
+
         logger.info(f"Loading Whisper model: {settings.WHISPER_MODEL_SIZE}")
         # Run on CPU for broad compatibility, change to "cuda" if GPU available
         self.model = WhisperModel(settings.WHISPER_MODEL_SIZE, device="cpu", compute_type="int8")
+        return True
+
+    def warm_up(self) -> None:
+        # One second of silence is enough to initialize the encoder/decoder
+        self._transcribe(np.zeros(16000, dtype=np.float32))
+
+    def _transcribe(self, audio):
+        segments, info = self.model.transcribe(audio, beam_size=5)
+        # Segments are a lazy generator; consume it here so decoding stays off the event loop
+        return [
+            {"start": segment.start, "end": segment.end, "text": segment.text}
+            for segment in segments
+        ]
 
     async def process_next(self, session: AsyncSession) -> bool:
-        # Find next UPLOADED note
-        query = select(Note).where(Note.status == NoteStatus.UPLOADED).order_by(Note.created_at).limit(1)
-        result = await session.execute(query)
-        note = result.scalar_one_or_none()
+        # Claim next NORMALIZED note
+        note = await self.claim_next(session, NoteStatus.NORMALIZED)
 
         if not note:
             return False
@@ -30,16 +47,25 @@ class TranscriberWorker(BaseWorker):
         logger.info(f"Transcribing note: {note.id}")
         
         try:
+            # Prefer the cached 16 kHz mono PCM; fall back to decoding the original upload
+            if note.normalized_path and os.path.exists(note.normalized_path):
+                audio = await asyncio.to_thread(load_pcm, note.normalized_path)
+            else:
+                audio = note.audio_path
+
             # Run transcription in thread pool to avoid blocking async loop
-            segments, info = await asyncio.to_thread(
-                self.model.transcribe, note.audio_path, beam_size=5
-            )
+            segments = await asyncio.to_thread(self._transcribe, audio)
             
             # Collect all segments
-            transcript_text = "".join([segment.text for segment in segments])
+            transcript_text = "".join([segment["text"] for segment in segments])
             
-            note.transcript = transcript_text.strip()
-            note.status = NoteStatus.TRANSCRIBED
+            # merge() so a retried note overwrites any earlier transcript row
+            await session.merge(NoteTranscript(
+                note_id=note.id,
+                content=transcript_text.strip(),
+                segments=segments
+            ))
+            self.complete(note, NoteStatus.TRANSCRIBED)
             session.add(note)
             await session.commit()
             logger.info(f"Transcription complete for: {note.id}")
@@ -47,10 +73,7 @@ class TranscriberWorker(BaseWorker):
             
         except Exception as e:
             logger.error(f"Transcription failed for {note.id}: {e}")
-            note.status = NoteStatus.ERROR
-            note.metadata_ = {"error": str(e)}
-            session.add(note)
-            await session.commit()
+            await self.fail(session, note, e)
             return True
 
 if __name__ == "__main__":
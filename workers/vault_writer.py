@@ -2,7 +2,7 @@ import asyncio
 import os
 import yaml
 from datetime import datetime
-from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import settings
@@ -17,9 +17,7 @@ class VaultWriterWorker(BaseWorker):
         super().__init__("VaultWriterWorker")
 
     async def process_next(self, session: AsyncSession) -> bool:
-        query = select(Note).where(Note.status == NoteStatus.PROCESSED).order_by(Note.created_at).limit(1)
-        result = await session.execute(query)
-        note = result.scalar_one_or_none()
+        note = await self.claim_next(session, NoteStatus.PROCESSED, selectinload(Note.transcript_record))
 
         if not note:
             return False
@@ -71,7 +69,7 @@ class VaultWriterWorker(BaseWorker):
             with open(file_path, "w", encoding="utf-8") as f:
                 f.write(file_content)
                 
-            note.status = NoteStatus.DONE
+            self.complete(note, NoteStatus.DONE)
             session.add(note)
             await session.commit()
             logger.info(f"Vault write complete: {file_path}")
@@ -79,10 +77,7 @@ class VaultWriterWorker(BaseWorker):
 
         except Exception as e:
             logger.error(f"Vault write failed for {note.id}: {e}")
-            note.status = NoteStatus.ERROR
-            note.metadata_ = {"error": str(e)}
-            session.add(note)
-            await session.commit()
+            await self.fail(session, note, e)
             return True
 
 if __name__ == "__main__":